@@ -13,55 +13,330 @@ Classes:
     GameEngine: Controls the game flow and evaluates the bot's guesses.
 """
 
+from __future__ import annotations
+
+import functools
+import mmap
+import os
 import random
+from multiprocessing import Pool, shared_memory
+from typing import Callable, NamedTuple, Optional, Union
+
+# NumPy is optional: without it, words are stored as bytes and filtered with
+# plain Python loops instead of arrays.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# How many distinct feedback results each word file remembers the filtered
+# words for. Each entry is one bit per word (about 1.6 KB for 13k words).
+FEEDBACK_CACHE_SIZE = 10_000
+
+
+def _letter_bits(words: np.ndarray) -> np.ndarray:
+    """Returns one 26-bit mask per word where bit k is set if letter k
+    ('A' + k) is anywhere in the word."""
+    bits = np.zeros(len(words), dtype=np.uint32)
+    for i in range(words.shape[1]):
+        bits |= np.uint32(1) << (words[:, i].astype(np.uint32) - ord('A'))
+    return bits
+
+
+def _parse_word_file(path: str) -> np.ndarray:
+    """Reads a word file into an (N, 5) array of uppercase ASCII codes.
+
+    The file is memory-mapped and parsed as raw bytes, so no Python string is
+    created per word. Words may be separated by any ASCII whitespace.
+
+    Raises:
+        ValueError: If the file contains a word that is not five letters long
+                    or a character outside A to Z.
+    """
+    if os.path.getsize(path) == 0:
+        return np.empty((0, 5), dtype=np.uint8)
+
+    with open(path, 'rb') as file, mmap.mmap(
+        file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped:
+        raw = np.frombuffer(mapped, dtype=np.uint8)
+
+        # Find where each word starts and ends by looking for the edges between
+        # whitespace and non-whitespace bytes. Only the bytes that bytes.split()
+        # treats as whitespace separate words; anything else is checked as a letter.
+        is_space = np.isin(raw, np.frombuffer(b" \t\n\r\x0b\x0c", dtype=np.uint8))
+        is_letter = np.concatenate(([False], ~is_space, [False]))
+        edges = np.flatnonzero(is_letter[1:] != is_letter[:-1])
+        all_five_letters = bool(np.all(edges[1::2] - edges[::2] == 5))
+
+        # Copy out just the letters; this is the only copy of the file made.
+        words = raw[is_letter[1:-1]]
+        del raw  # release the buffer so the mapping can be closed
+
+    if not all_five_letters:
+        raise ValueError(f"{path} must contain only five-letter words")
+
+    # Uppercase in place: 'a'..'z' are exactly 32 above 'A'..'Z' in ASCII.
+    np.subtract(
+        words, 32, where=(words >= ord('a')) & (words <= ord('z')), out=words
+    )
+    if not np.all((words >= ord('A')) & (words <= ord('Z'))):
+        raise ValueError(f"{path} must contain only the letters A to Z")
+    return words.reshape(-1, 5)
+
+
+def _read_word_bytes(path: str) -> list[bytes]:
+    """Reads a word file into a list of uppercase ASCII words, without NumPy.
+
+    Raises:
+        ValueError: If the file contains a word that is not five letters long
+                    or a character outside A to Z.
+    """
+    with open(path, 'rb') as file:
+        words = file.read().upper().split()
+    if not all(len(word) == 5 and word.isalpha() for word in words):
+        raise ValueError(f"{path} must contain only five-letter words of the letters A to Z")
+    return words
+
+
+class WordTable(NamedTuple):
+    """A parsed word file, shared read-only by every Bot and GameEngine using it.
+
+    Without NumPy, words is a tuple of bytes objects, bits and scores are
+    tuples of ints, and pos_mask and feedback_mask are None.
+
+    Attributes:
+        words (np.ndarray): (N, 5) uint8 array of uppercase ASCII codes.
+        bits (np.ndarray): (N,) uint32 array; bit k is set if letter k
+                           ('A' + k) is anywhere in the word.
+        strs (tuple[str, ...]): The same N words as strings.
+        str_set (frozenset[str]): The same words as a set, for constant-time
+                                  membership tests.
+        str_index (dict[str, int]): The row of each word, so a guess can be
+                                    found without scanning strs.
+        pos_mask (np.ndarray): (5, 26, ceil(N / 8)) uint8 array; pos_mask[i, k]
+                               is the packed set of words with letter k at
+                               position i.
+        scores (np.ndarray): (N,) int64 array; the sum, over each distinct
+                             letter in the word, of how many times that letter
+                             appears across the whole file.
+        feedback_mask (Callable): feedback_mask(green_pos, yellow_pos,
+                                  grey_letters) returns the packed set of words
+                                  that pass that feedback. Results are cached,
+                                  so games that see the same feedback share them.
+    """
+
+    words: np.ndarray
+    bits: np.ndarray
+    strs: tuple[str, ...]
+    str_set: frozenset[str]
+    str_index: dict[str, int]
+    pos_mask: np.ndarray
+    scores: np.ndarray
+    feedback_mask: Optional[Callable[..., np.ndarray]]
+
+
+def _str_index(strs: tuple[str, ...]) -> dict[str, int]:
+    """Maps each word to its row in a WordTable."""
+    return {word: i for i, word in enumerate(strs)}
+
+
+def _build_table(words: np.ndarray) -> WordTable:
+    """Builds the lookup structures derived from an (N, 5) word array."""
+    bits = _letter_bits(words)
+    text = words.tobytes().decode("ascii")
+    strs = tuple(text[i:i + 5] for i in range(0, len(text), 5))
+
+    pos_mask = np.empty((5, 26, (len(words) + 7) // 8), dtype=np.uint8)
+    for i in range(5):
+        for k in range(26):
+            pos_mask[i, k] = np.packbits(words[:, i] == ord('A') + k)
+
+    # Letter-frequency score: common letters score high, and a repeated letter
+    # only counts once, so words that test more distinct letters are preferred.
+    letter_freq = np.bincount(words.ravel(), minlength=256)[ord('A'):ord('Z') + 1]
+    has_letter = (bits[:, None] >> np.arange(26, dtype=np.uint32)) & 1
+    scores = has_letter.astype(np.int64) @ letter_freq.astype(np.int64)
+
+    for array in (words, bits, pos_mask, scores):
+        array.setflags(write=False)
+
+    feedback_mask = functools.lru_cache(maxsize=FEEDBACK_CACHE_SIZE)(
+        functools.partial(_feedback_mask, words, bits, pos_mask)
+    )
+    return WordTable(words, bits, strs, frozenset(strs), _str_index(strs), pos_mask, scores, feedback_mask)
+
+
+def _build_bytes_table(words: list[bytes]) -> WordTable:
+    """Builds a WordTable without NumPy from a list of five-byte words."""
+    bits = []
+    for word in words:
+        mask = 0
+        for code in word:
+            mask |= 1 << (code - ord('A'))
+        bits.append(mask)
+
+    letter_freq = [0] * 26
+    for word in words:
+        for code in word:
+            letter_freq[code - ord('A')] += 1
+    scores = tuple(
+        sum(letter_freq[k] for k in range(26) if mask >> k & 1) for mask in bits
+    )
+
+    strs = tuple(word.decode("ascii") for word in words)
+    return WordTable(tuple(words), tuple(bits), strs, frozenset(strs), _str_index(strs), None, scores, None)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_words(path: str, mtime: float) -> WordTable:
+    """Loads and caches a word file as a WordTable.
+
+    The cache is keyed on the file's modification time as well as its path, so
+    an edited file is read again. The returned arrays are shared by every
+    caller and are therefore marked read-only.
+    """
+    if np is None:
+        return _build_bytes_table(_read_word_bytes(path))
 
+    words = _parse_word_file(path)
+    return _build_table(words)
 
 
-class Letter:
+# Tables that run_games' worker processes built over shared memory, by path.
+_shared_tables: dict[str, WordTable] = {}
+
+
+def load_words(path: str) -> WordTable:
+    """Returns the cached WordTable for a word file."""
+    table = _shared_tables.get(path)
+    if table is not None:
+        return table
+    return _load_words(path, os.path.getmtime(path))
+
+
+# Bits of Letter.flags. A letter in the correct place is always in the word too.
+IN_CORRECT_PLACE = 0b01
+IN_WORD = 0b10
+
+
+class Letter(NamedTuple):
     """Represents a single letter from a guess and its feedback status. 
 
     This class acts as a data structure to hold a single character from a guess
     and the results of that guess (e.g., if it's in the word, if it's in the
-    correct position). [cite: 2]
+    correct position). [cite: 2] Both results are packed into one small int,
+    so a Letter is an immutable tuple rather than an object with attributes.
 
     Attributes:
         letter (str): The character itself (e.g., 'A').
+        flags (int): IN_WORD and/or IN_CORRECT_PLACE bits. It defaults to 0
+                     because the feedback for this letter is unknown until
+                     the GameEngine evaluates it.
         in_word (bool): True if the letter is in the target word.
         in_correct_place (bool): True if the letter is in the correct position.
     """
 
-    def __init__(self, letter: str) -> None:
-        """Initializes the Letter object with a character. 
-        
-        This is the constructor. When you create a Letter object, you give it a 
-        character (e.g., 'A'), which it stores. The feedback attributes, in_word 
-        and in_correct_place, are initialized to False because their true status 
-        is unknown until the GameEngine evaluates them. 
-        """
-        self.letter: str = letter
-        
-        # The status flags start as False because the feedback for this letter
-        # is unknown until the GameEngine evaluates it.
-        self.in_word: bool = False
-        self.in_correct_place: bool = False
+    letter: str
+    flags: int = 0
 
     def __repr__(self) -> str:
         """Provides a developer-friendly string representation for debugging."""
         return f"Letter('{self.letter}', in_word={self.in_word}, in_correct_place={self.in_correct_place})"
-    
+
+    @property
+    def in_word(self) -> bool:
+        """True if the letter is in the target word."""
+        return bool(self.flags & IN_WORD)
+
+    @property
+    def in_correct_place(self) -> bool:
+        """True if the letter is in the correct position."""
+        return bool(self.flags & IN_CORRECT_PLACE)
+
     """is_in_word(self) and is_in_correct_place(self): 
            These are simple "getter" methods. 
            They don't change anything; they just return the current boolean value of their 
-           corresponding attribute. The GameEngine uses these methods to check the feedback 
+           corresponding flag. The GameEngine uses these methods to check the feedback 
            for each letter.
     """
     def is_in_word(self) -> bool:
         """Returns the status of the in_word flag."""
-        return self.in_word
+        return bool(self.flags & IN_WORD)
 
     def is_in_correct_place(self) -> bool:
         """Returns the status of the in_correct_place flag."""
-        return self.in_correct_place
+        return bool(self.flags & IN_CORRECT_PLACE)
+
+
+def _sort_feedback(
+    guess_results: list[Letter],
+) -> tuple[list[tuple[int, int]], list[tuple[int, int]], list[int]]:
+    """Sorts one guess's feedback into the three kinds of rule.
+
+    Returns:
+        A (green_pos, yellow_pos, grey_letters) tuple. green_pos holds the
+        (position, letter code) pairs that must match exactly, yellow_pos the
+        (position, letter code) pairs in the word but elsewhere, and
+        grey_letters the letter codes that must not appear in the word at all.
+    """
+    green_pos = []
+    yellow_pos = []
+    grey_letters = []
+    for i, (letter, flags) in enumerate(guess_results):
+        code = ord(letter)
+        if flags & IN_CORRECT_PLACE:
+            green_pos.append((i, code))
+        elif flags & IN_WORD:
+            yellow_pos.append((i, code))
+        else:
+            grey_letters.append(code)
+
+    # A grey letter can be eliminated ONLY if it doesn't also appear
+    # as a green or yellow in the SAME guess (e.g., guess "ARRAY" for target "ALARM").
+    positive_letters = {code for _, code in green_pos + yellow_pos}
+    grey_letters = [code for code in grey_letters if code not in positive_letters]
+    return green_pos, yellow_pos, grey_letters
+
+
+def _feedback_mask(
+    words: np.ndarray,
+    bits: np.ndarray,
+    pos_mask: np.ndarray,
+    green_pos: tuple[tuple[int, int], ...],
+    yellow_pos: tuple[tuple[int, int], ...],
+    grey_letters: tuple[int, ...],
+) -> np.ndarray:
+    """Returns the packed set of words that pass one guess's feedback.
+
+    This checks every word of the table, not just a bot's candidates, so the
+    result depends only on the feedback and can be cached and shared between
+    bots. The rules are those returned by _sort_feedback.
+    """
+    # Each rule is applied to every word at once and ANDed into the
+    # packed result. Letter presence (yellow and grey) is checked against the
+    # bitmasks first, then the positional rules use the packed index.
+    must_have_mask = 0
+    for _, code in green_pos + yellow_pos:
+        must_have_mask |= 1 << (code - ord('A'))
+    must_not_have_mask = 0
+    for code in grey_letters:
+        must_not_have_mask |= 1 << (code - ord('A'))
+    letters_ok = (bits & must_have_mask) == must_have_mask
+    letters_ok &= (bits & must_not_have_mask) == 0
+    mask = np.packbits(letters_ok)
+
+    # Rule 1: Green letters (correct letter, correct place)
+    for i, code in green_pos:
+        mask &= pos_mask[i, code - ord('A')]
+
+    # Rule 2: Yellow letters (correct letter, wrong place)
+    for i, code in yellow_pos:
+        mask &= ~pos_mask[i, code - ord('A')]
+
+    mask.setflags(write=False)
+    return mask
 
 
 class Bot:
@@ -70,98 +345,146 @@ class Bot:
     def __init__(self, word_list_file: str) -> None:
         """Initializes the Bot with a list of possible words.
 
-        This constructor reads a specified text file, cleans up each word
+        This constructor loads a specified text file, cleans up each word
         (by removing whitespace and converting to uppercase), and stores
-        the resulting words in a list for the bot to use.
+        the resulting words for the bot to use: as a NumPy array of ASCII
+        codes, or as a tuple of bytes when NumPy is not installed. The parsed
+        file is cached, so further bots for the same file share it.
 
         Args:
             word_list_file (str): The path to a text file containing
                                   valid words, one per line.
         """
-        # This list will hold all words the bot considers possible answers.
+        table = load_words(word_list_file)
+
+        # Every word from the file, stored as one contiguous (N, 5) array of
+        # ASCII codes (or a tuple of bytes without NumPy). This is shared with
+        # other bots and never modified.
+        self.words: Union[np.ndarray, tuple[bytes, ...]] = table.words
+
+        # The same words as strings, used only to hand a guess back to the GameEngine.
+        self.word_strs: tuple[str, ...] = table.strs
+
+        # The row of each word, used to drop a guess from the candidates.
+        self.word_index: dict[str, int] = table.str_index
+
+        # Returns the packed set of words that pass a guess's feedback, shared
+        # and cached across every bot using the same word file.
+        self.feedback_mask: Optional[Callable[..., np.ndarray]] = table.feedback_mask
+
+        # How useful each word is as a guess, from the letter frequencies of
+        # the whole file.
+        self.word_scores: Union[np.ndarray, tuple[int, ...]] = table.scores
+
+        # The words the bot still considers possible answers, as a packed bit
+        # per word of self.words (or a list of row indices without NumPy).
         # It is filtered down after each guess.
-        self.word_list: list[str] = []
-        
-        # 'with open(...)' ensures the file is closed automatically after reading.
-        with open(word_list_file, 'r') as file:
-            for word in file:
-                # .strip() removes whitespace/newlines and .upper() ensures
-                # all words are uppercase to match the GameEngine's format.
-                self.word_list.append(word.strip().upper())
+        self.candidates: Union[np.ndarray, list[int]]
+        if np is None:
+            self.candidates = list(range(len(self.words)))
+        else:
+            self.candidates = np.packbits(np.ones(len(self.words), dtype=bool))
+
+    def _candidate_indices(self) -> np.ndarray:
+        """Returns the row indices of the words still considered possible."""
+        return np.flatnonzero(np.unpackbits(self.candidates, count=len(self.words)))
+
+    @property
+    def word_list(self) -> list[str]:
+        """The words the bot still considers possible answers."""
+        if np is None:
+            return [self.word_strs[i] for i in self.candidates]
+        return [self.word_strs[i] for i in self._candidate_indices().tolist()]
 
 
     def make_guess(self) -> str:
         """Selects and returns a single word from the current list of possibilities.
 
-        This method is called by the GameEngine at the start of each turn. As the
-        word_list is filtered down by the record_guess_results method, the
-        random choice made here becomes progressively more strategic.
+        This method is called by the GameEngine at the start of each turn. It
+        picks the possible word with the highest letter-frequency score, i.e.
+        the one that tests the most common distinct letters, so each guess
+        tends to eliminate as many words as possible.
         
         Returns:
             str: The bot's next guess.
         """
-        # Use the random.choice() function to pick one word from the list
-        # of words the bot currently thinks are possible.
-        guess = random.choice(self.word_list)
+        # Pick the best-scoring word of those the bot currently thinks are possible.
+        if np is None:
+            return self.word_strs[max(self.candidates, key=self.word_scores.__getitem__)]
+        indices = self._candidate_indices()
+        guess = self.word_strs[int(indices[np.argmax(self.word_scores[indices])])]
         return guess
 
 
     def record_guess_results(self, guess: str, guess_results: list[Letter]) -> None:
         """Filters the bot's word list based on guess feedback.
 
-        This method is the core logic of the bot. It iterates through its
-        list of possible words, eliminating any word that violates the rules
-        learned from the feedback provided by the GameEngine.
+        This method is the core logic of the bot. It turns each rule learned
+        from the GameEngine's feedback into a mask over the word array and
+        keeps only the candidate words that pass every rule.
 
         Args:
             guess (str): The word that was just guessed.
             guess_results (list[Letter]): A list of Letter objects representing the
                                          feedback for the guess.
         """
-        # Remove the guessed word from the list to prevent repeats.
-        if guess in self.word_list:
-            self.word_list.remove(guess)
-        
-        # Create a new, empty list to hold only the words that pass all the rules.
-        new_possible_words = []
+        # A fully correct guess ends the game, so there is nothing left to filter.
+        if all(flags & IN_CORRECT_PLACE for _, flags in guess_results):
+            self.candidates[:] = [] if np is None else 0
+            return
+
+        # Sort the feedback into the three kinds of rule before touching the words,
+        # so nothing below needs to look at the Letter objects again.
+        green_pos, yellow_pos, grey_letters = _sort_feedback(guess_results)
+
+        # The rules usually reject the guess itself, but not always: a grey letter
+        # that is also green or yellow elsewhere in the guess is not checked.
+        # So the guess is removed explicitly, found by its row in O(1).
+        guess_index = self.word_index.get(guess)
+
+        if np is None:
+            self._filter_bytes(green_pos, yellow_pos, grey_letters, guess_index)
+            return
+
+        # The same feedback always allows the same words, so the packed set is
+        # looked up in the table's cache, keyed on the canonical rules.
+        self.candidates &= self.feedback_mask(
+            tuple(green_pos), tuple(yellow_pos), tuple(sorted(set(grey_letters)))
+        )
 
-        # Check every remaining word against the feedback from the last guess.        
-        for word in self.word_list:
-            is_still_possible = True
+        # Remove the guessed word from the candidates to prevent repeats.
+        if guess_index is not None:
+            self.candidates[guess_index // 8] &= ~np.uint8(0x80 >> (guess_index % 8))
 
-            # This inner loop checks the current 'word' against each letter's feedback.            
-            for i, feedback in enumerate(guess_results):
-                char_in_guess = feedback.letter
+    def _filter_bytes(
+        self,
+        green_pos: list[tuple[int, int]],
+        yellow_pos: list[tuple[int, int]],
+        grey_letters: list[int],
+        guess_index: Optional[int],
+    ) -> None:
+        """Filters the candidates one word at a time when NumPy is unavailable.
 
+        Each word is a bytes object, so word[i] is an int and the rules are
+        integer compares and C-level `in` tests on bytes, with no
+        one-character strings created. The guessed word, at row guess_index,
+        is always dropped.
+        """
+        new_candidates = []
+        for index in self.candidates:
+            word = self.words[index]
+            if (
+                # The guessed word itself, to prevent repeats
+                index != guess_index
                 # Rule 1: Green letters (correct letter, correct place)
-                if feedback.is_in_correct_place():
-                    if word[i] != char_in_guess:
-                        is_still_possible = False
-                        break  # This word is invalid.
-                
+                and all(word[i] == code for i, code in green_pos)
                 # Rule 2: Yellow letters (correct letter, wrong place)
-                elif feedback.is_in_word():
-                    if char_in_guess not in word or word[i] == char_in_guess:
-                        is_still_possible = False
-                        break  # This word is invalid.
-                
+                and all(word[i] != code and code in word for i, code in yellow_pos)
                 # Rule 3: Grey letters (incorrect letter)
-                else:
-                    # A grey letter can be eliminated ONLY if it doesn't also appear
-                    # as a green or yellow in the SAME guess (e.g., guess "ARRAY" for target "ALARM").
-                    is_positive_somewhere = any(
-                        char_in_guess == f.letter and f.is_in_word() for f in guess_results
-                    )
-                    if not is_positive_somewhere and char_in_guess in word:
-                        is_still_possible = False
-                        break  # This word is invalid.
-            
-            # If the word survived all the checks, add it to our new list.
-            if is_still_possible:
-                new_possible_words.append(word)
-        
-        # Finally, replace the old word list with the newly filtered, smaller list.
-        self.word_list = new_possible_words
+                and not any(code in word for code in grey_letters)
+            ):
+                new_candidates.append(index)
+        self.candidates = new_candidates
 
 
 class GameEngine:
@@ -170,15 +493,23 @@ class GameEngine:
     def __init__(self):
         self.err_input = False
         self.err_guess = False
-        self.prev_guesses = []  # record the previous guesses
+        self.prev_guesses = set()  # record the previous guesses
 
     def play(
-        self, bot, word_list_file: str = "words.txt", target_word: str = None
-    ) -> None:
+        self,
+        bot,
+        word_list_file: str = "words.txt",
+        target_word: str = None,
+        verbose: bool = True,
+    ) -> Optional[int]:
         """Plays a new game, using the supplied bot. By default the GameEngine
         will look in words.txt for the list of allowable words and choose one
         at random. Set the value of target_word to override this behavior and
-        choose the word that must be guessed by the bot.
+        choose the word that must be guessed by the bot. Set verbose to False
+        to play silently, e.g. when evaluating a bot over many games.
+
+        Returns the number of guesses the bot needed, or None if it did not
+        find the target word.
         """
 
         def format_results(results) -> str:
@@ -197,39 +528,37 @@ class GameEngine:
 
         def set_feedback(guess: str, target_word: str) -> tuple[bool, list[Letter]]:
             # whether the complete guess is correct
-            # set it to True initially and then switch it to False if any letter doesn't match
-            correct: bool = True
+            correct: bool = guess == target_word
 
+            # a plain loop is fastest here: the words are only five characters long
             letters = []
-            for j in range(len(guess)):
-                # create a new Letter object
-                letter = Letter(guess[j])
+            for j, c in enumerate(guess):
+                # the feedback for this character, packed as Letter flags
+                flags = 0
 
                 # check to see if this character is in the same position in the
-                # guess and if so set the in_correct_place attribute
-                if guess[j] == target_word[j]:
-                    letter.in_correct_place = True
-                    known_letters[j] = guess[j]  # record the known correct positions
-                else:
-                    # we know they don't have a perfect answer, so let's update
-                    # our correct variable for feedback
-                    correct = False
+                # guess and if so set the in_correct_place flag
+                if c == target_word[j]:
+                    flags |= IN_CORRECT_PLACE
+                    known_letters[j] = c  # record the known correct positions
 
                 # check to see if this character is anywhere in the word
-                if guess[j] in target_word:
-                    letter.in_word = True
+                if c in target_word:
+                    flags |= IN_WORD
                 else:
-                    unused_letters.add(guess[j])  # record the unused letters
+                    unused_letters.add(c)  # record the unused letters
 
-                # add this letter to our list of letters
-                letters.append(letter)
+                # create the Letter and add it to our list of letters
+                letters.append(Letter(c, flags))
 
             return correct, letters
 
         # read in the dictionary of allowable words
-        word_list: list(str) = list(
-            map(lambda x: x.strip().upper(), open(word_list_file, "r").readlines())
-        )
+        table = load_words(word_list_file)
+        word_list: list(str) = table.strs
+        # a set gives constant-time membership tests for each guess; it is
+        # built once per word file with the rest of the cached table
+        word_set: frozenset[str] = table.str_set
         # record the known correct positions
         known_letters: list(str) = [None, None, None, None, None]
         # set of unused letters
@@ -237,17 +566,19 @@ class GameEngine:
 
         # assign the target word to a member variable for use later
         if target_word is None:
-            target_word = random.choice(word_list).upper()
+            target_word = random.choice(word_list)  # already uppercase from the loader
         else:
             target_word = target_word.upper()
-            if target_word not in word_list:
-                print(f"Target word {target_word} must be from the word list")
+            if target_word not in word_set:
+                if verbose:
+                    print(f"Target word {target_word} must be from the word list")
                 self.err_input = True
                 return
 
-        print(
-            f"Playing a game of WordyPy using the word list file of {word_list_file}.\nThe target word for this round is {target_word}\n"
-        )
+        if verbose:
+            print(
+                f"Playing a game of WordyPy using the word list file of {word_list_file}.\nThe target word for this round is {target_word}\n"
+            )
 
         MAX_GUESSES = 6
         for i in range(1, MAX_GUESSES):
@@ -255,31 +586,36 @@ class GameEngine:
             guess: str = bot.make_guess()
 
             # print out a line indicating what the guess was
-            print(f"Evaluating bot guess of {guess}")
+            if verbose:
+                print(f"Evaluating bot guess of {guess}")
 
-            if guess not in word_list:
-                print(f"Guessed word {guess} must be from the word list")
+            if guess not in word_set:
+                if verbose:
+                    print(f"Guessed word {guess} must be from the word list")
                 self.err_guess = True
             elif guess in self.prev_guesses:
-                print(f"Guess word cannot be the same one as previously used!")
+                if verbose:
+                    print(f"Guess word cannot be the same one as previously used!")
                 self.err_guess = True
 
             if self.err_guess:
                 return
 
-            self.prev_guesses.append(guess)  # record the previous guess
+            self.prev_guesses.add(guess)  # record the previous guess
 
             for j, letter in enumerate(guess):
                 if letter in unused_letters:
-                    print(
-                        f"The bot's guess used {letter} which was previously identified as not used!"
-                    )
+                    if verbose:
+                        print(
+                            f"The bot's guess used {letter} which was previously identified as not used!"
+                        )
                     self.err_guess = True
                 if known_letters[j] is not None:
                     if letter != known_letters[j]:
-                        print(
-                            f"Previously identified {known_letters[j]} in the correct position is not used at position {j}!"
-                        )
+                        if verbose:
+                            print(
+                                f"Previously identified {known_letters[j]} in the correct position is not used at position {j}!"
+                            )
                         self.err_guess = True
 
                 if self.err_guess:
@@ -289,25 +625,104 @@ class GameEngine:
             correct, results = set_feedback(guess, target_word)
 
             # print out a line indicating whether the guess was correct or not
-            print(f"Was this guess correct? {correct}")
+            if verbose:
+                print(f"Was this guess correct? {correct}")
 
-            print(f"Sending guess results to bot {format_results(results)}\n")
+                print(f"Sending guess results to bot {format_results(results)}\n")
 
             bot.record_guess_results(guess, results)
 
             # if they got it correct we can just end
             if correct:
-                print(f"Great job, you found the target word in {i} guesses!")
-                return
+                if verbose:
+                    print(f"Great job, you found the target word in {i} guesses!")
+                return i
 
         # if we get here, the bot didn't guess the word
-        print(
-            f"Thanks for playing! You didn't find the target word in the number of guesses allowed."
-        )
+        if verbose:
+            print(
+                f"Thanks for playing! You didn't find the target word in the number of guesses allowed."
+            )
         return
 
 
 
+# The shared memory block a run_games worker process is attached to.
+_worker_shm: Optional[shared_memory.SharedMemory] = None
+
+
+def _init_worker(word_list_file: str, shm_name: str, shape: tuple[int, int]) -> None:
+    """Attaches a run_games worker to the parent's shared copy of the words."""
+    global _worker_shm
+    _worker_shm = shared_memory.SharedMemory(name=shm_name)
+    words = np.ndarray(shape, dtype=np.uint8, buffer=_worker_shm.buf)
+    _shared_tables[word_list_file] = _build_table(words)
+
+
+def _play_one(job: tuple[str, str]) -> Optional[int]:
+    """Plays one silent game in a run_games worker."""
+    target_word, word_list_file = job
+    return GameEngine().play(
+        Bot(word_list_file), word_list_file, target_word, verbose=False
+    )
+
+
+def run_games(
+    targets: list[str],
+    word_list_file: str = "words.txt",
+    processes: Optional[int] = None,
+) -> list[Optional[int]]:
+    """Plays one silent game per target word, spread over a process pool.
+
+    The word file is parsed once here and its words are placed in shared
+    memory, which every worker process reads instead of parsing the file again.
+    Without NumPy, every worker loads the file itself.
+
+    Args:
+        targets (list[str]): The target words to play, from the word list.
+                             Case does not matter.
+        word_list_file (str): The path to the word list file.
+        processes (int): The number of worker processes; defaults to the
+                         number of CPUs.
+
+    Returns:
+        list[Optional[int]]: The number of guesses the bot needed for each
+                             target word, in the order of targets, or None
+                             where it did not find the word.
+
+    Raises:
+        ValueError: If a target word is not in the word list.
+    """
+    table = load_words(word_list_file)
+    targets = [target.upper() for target in targets]
+    unknown = [target for target in targets if target not in table.str_set]
+    if unknown:
+        raise ValueError(f"Target words must be from the word list: {unknown}")
+
+    jobs = [(target, word_list_file) for target in targets]
+    workers = processes or os.cpu_count() or 1
+    chunksize = max(1, len(jobs) // (4 * workers))
+
+    # Without NumPy there is no array to share, so each worker loads the file.
+    if np is None:
+        with Pool(workers) as pool:
+            return list(pool.imap(_play_one, jobs, chunksize))
+
+    words = table.words
+    shm = shared_memory.SharedMemory(create=True, size=max(words.nbytes, 1))
+    try:
+        shm.buf[:words.nbytes] = words.tobytes()
+        with Pool(
+            workers,
+            initializer=_init_worker,
+            initargs=(word_list_file, shm.name, words.shape),
+        ) as pool:
+            return list(pool.imap(_play_one, jobs, chunksize))
+    finally:
+        shm.close()
+        shm.unlink()
+
+
 # =====================================================================
 # SCRIPT EXECUTION
 # =====================================================================